@@ -7,12 +7,18 @@ import sys
 import os
 import uuid
 import importlib
+import functools
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 
 import cv2
 import numpy as np
 from PyQt6.QtCore import (
-    Qt, QPointF, QRectF, pyqtSignal, QThread, QObject
+    Qt, QPointF, QRectF, pyqtSignal, QObject, QRunnable, QThreadPool
 )
 from PyQt6.QtGui import (
     QImage, QPixmap, QPen, QBrush, QColor, QPainter, QFont,
@@ -21,7 +27,7 @@ from PyQt6.QtGui import (
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QGraphicsView, QGraphicsScene,
     QGraphicsPixmapItem, QGraphicsEllipseItem, QGraphicsLineItem,
-    QGraphicsTextItem, QFileDialog, QListWidget, QListWidgetItem,
+    QFileDialog, QListWidget,
     QDockWidget, QVBoxLayout, QHBoxLayout, QWidget, QPushButton,
     QLabel, QInputDialog, QMessageBox, QStatusBar, QSplitter,
     QGroupBox, QLineEdit, QProgressBar, QSizePolicy, QSlider
@@ -40,12 +46,29 @@ WARP_HI_W, WARP_HI_H = 500, 100       # high-res buffer
 FINAL_W, FINAL_H = 140, 28             # final strip size
 SEGMENT_SIZE = 28                       # each digit cell
 NUM_SEGMENTS = 5
+IMAGE_CACHE_SIZE = 8                    # decoded images kept for revisits
+DISPLAY_MAX_SIDE = 2048                 # longest edge of the on-screen copy
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]   # fast zlib level
+INVERT_PROGRESS_STEP = 50               # files between Invert Colors updates
+MMAP_MIN_BYTES = 1 << 20                # files this big are decoded from a mmap
 IMAGE_EXTENSIONS = {
     '.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.webp', '.heic', '.heif'
 }
+_EXT_TUPLE = tuple(IMAGE_EXTENSIONS)     # for str.endswith on lowercased names
 HEIF_DECODER_AVAILABLE = False
 _PIL_IMAGE_MODULE = None
 
+# Shared by every Save; threads are started lazily on first use
+_SAVE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="save")
+
+# Corners of the high-res warp buffer, in TL, TR, BR, BL order
+_DST_RECT = np.array([
+    [0, 0],
+    [WARP_HI_W - 1, 0],
+    [WARP_HI_W - 1, WARP_HI_H - 1],
+    [0, WARP_HI_H - 1]
+], dtype=np.float32)
+
 
 def _ensure_heif_decoder() -> bool:
     """Lazily initialize HEIC/HEIF decoder dependencies."""
@@ -66,7 +89,23 @@ def _ensure_heif_decoder() -> bool:
 
 def read_image_any(path: str, flags: int = cv2.IMREAD_COLOR) -> np.ndarray | None:
     """Read common image formats with OpenCV, plus HEIC/HEIF via Pillow fallback."""
-    image = cv2.imread(path, flags)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                # Decode straight from the page cache, no bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    data = np.frombuffer(mapped, dtype=np.uint8)
+                    try:
+                        image = cv2.imdecode(data, flags)
+                    finally:
+                        # Release the view even if decoding raises, or the
+                        # map can't close and BufferError hides the error
+                        del data
+            else:
+                data = np.fromfile(f, dtype=np.uint8)
+                image = cv2.imdecode(data, flags) if data.size else None
+    except OSError:
+        return None
     if image is not None:
         return image
 
@@ -92,114 +131,281 @@ def read_image_any(path: str, flags: int = cv2.IMREAD_COLOR) -> np.ndarray | Non
         return None
 
 
+def write_image_any(path: str, image: np.ndarray, params=()) -> bool:
+    """Encode in memory and write the bytes ourselves (any path, any OS)."""
+    try:
+        ok, encoded = cv2.imencode(os.path.splitext(path)[1], image, params)
+        if ok:
+            encoded.tofile(path)
+        return ok
+    except (cv2.error, OSError):
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Utility: order 4 points as TL, TR, BR, BL
 # ---------------------------------------------------------------------------
-def order_points(pts: np.ndarray) -> np.ndarray:
-    """Sort 4 points into Top-Left, Top-Right, Bottom-Right, Bottom-Left."""
-    rect = np.zeros((4, 2), dtype=np.float32)
-    s = pts.sum(axis=1)
-    d = np.diff(pts, axis=1).ravel()
-    rect[0] = pts[np.argmin(s)]   # TL has smallest x+y
-    rect[2] = pts[np.argmax(s)]   # BR has largest  x+y
-    rect[1] = pts[np.argmin(d)]   # TR has smallest x-y
-    rect[3] = pts[np.argmax(d)]   # BL has largest  x-y
-    return rect
+def corner_indices(pts) -> tuple[int, int, int, int]:
+    """Indices of the TL, TR, BR, BL points among 4 (x, y) pairs."""
+    # Plain scalar math: for 4 points NumPy's per-call overhead dominates
+    s = [x + y for x, y in pts]
+    d = [y - x for x, y in pts]
+    return (
+        s.index(min(s)),   # TL has smallest x+y
+        d.index(min(d)),   # TR has smallest y-x
+        s.index(max(s)),   # BR has largest  x+y
+        d.index(max(d)),   # BL has largest  y-x
+    )
+
+
+def order_points(pts) -> np.ndarray:
+    """Sort 4 points into Top-Left, Top-Right, Bottom-Right, Bottom-Left.
+
+    Accepts a 4×2 array or a sequence of (x, y) pairs.
+    """
+    p = pts.tolist() if isinstance(pts, np.ndarray) else pts
+    return np.array([p[i] for i in corner_indices(p)], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=32)
+def _warp_matrix(src_key: bytes) -> np.ndarray:
+    """Inverse perspective map: _DST_RECT → ordered float32 source corners.
+
+    Solving for the inverse directly lets warpPerspective run with
+    WARP_INVERSE_MAP instead of inverting the matrix on every call.
+    """
+    src = np.frombuffer(src_key, dtype=np.float32).reshape(4, 2)
+    return cv2.getPerspectiveTransform(_DST_RECT, src)
+
+
+# ---------------------------------------------------------------------------
+# "Mirror" step: binarize the high-res warp and reduce it to the final strip
+# ---------------------------------------------------------------------------
+def binarize_strip(gray: np.ndarray, binary: np.ndarray, strip: np.ndarray):
+    """Threshold + 3×3 median on the 500×100 buffer, then downscale to 140×28.
+
+    Every stage writes into the caller's buffers (``binary`` is scratch,
+    ``strip`` receives the result), so the whole step allocates nothing.
+    """
+    # Local-mean threshold: 255 where the pixel beats its 11×11 mean by -C.
+    # MEAN_C runs on boxFilter's running sums, i.e. it already is the
+    # O(1)-per-pixel summed-area mean; an explicit integral image only
+    # adds passes. It also compares in signed arithmetic, so dark areas
+    # (mean < C) stay white instead of clamping.
+    cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                          cv2.THRESH_BINARY, 11, 2, dst=binary)
+    # 3×3 median == majority of 9 on bilevel input. OpenCV's 8-bit 3×3
+    # median is a SIMD sorting network; measured faster than the
+    # box-sum + compare(>= 5) formulation, so it stays.
+    cv2.medianBlur(binary, 3, dst=binary)
+    cv2.resize(binary, (FINAL_W, FINAL_H), dst=strip,
+               interpolation=cv2.INTER_AREA)
 
 
 # ---------------------------------------------------------------------------
-# CV Processing Worker (runs on a QThread to keep UI responsive)
+# CV Processing Worker (runs on the thread pool to keep UI responsive)
 # ---------------------------------------------------------------------------
 class ProcessingSignals(QObject):
-    finished = pyqtSignal(object)   # emits the 140x28 strip (numpy)
+    finished = pyqtSignal()         # the job's output strip has been written
     error = pyqtSignal(str)
 
 
-class WarpWorker(QThread):
-    """Perspective-warp → binarize → downscale in a background thread."""
+class WarpWorker(QRunnable):
+    """Perspective-warp → binarize → downscale in a background thread.
+
+    One instance lives for the whole session and is resubmitted to a
+    single-thread pool for every extraction, so its scratch buffers
+    survive between jobs and are never used by two runs at once.
+    """
 
-    def __init__(self, image: np.ndarray, points: np.ndarray):
+    def __init__(self):
         super().__init__()
+        self.setAutoDelete(False)
         self.signals = ProcessingSignals()
+        self.image: np.ndarray | None = None
+        self.points: np.ndarray | None = None
+        self.out_strip: np.ndarray | None = None
+
+        # Scratch buffers reused by every extraction (sizes never change)
+        self._warp_buf = np.empty((WARP_HI_H, WARP_HI_W, 3), np.uint8)
+        self._gray_buf = np.empty((WARP_HI_H, WARP_HI_W), np.uint8)
+        self._bin_buf = np.empty((WARP_HI_H, WARP_HI_W), np.uint8)
+
+    def set_job(self, image: np.ndarray, points: np.ndarray,
+                out_strip: np.ndarray):
+        """Set the input for the next run and the 140×28 buffer it fills.
+
+        ``points`` are the TL, TR, BR, BL corners in image coordinates.
+        """
         self.image = image
         self.points = points
+        self.out_strip = out_strip
 
     def run(self):
         try:
-            src = order_points(self.points)
-            dst = np.array([
-                [0, 0],
-                [WARP_HI_W - 1, 0],
-                [WARP_HI_W - 1, WARP_HI_H - 1],
-                [0, WARP_HI_H - 1]
-            ], dtype=np.float32)
-            M = cv2.getPerspectiveTransform(src, dst)
-            warped = cv2.warpPerspective(self.image, M, (WARP_HI_W, WARP_HI_H))
-
-            # Convert to grayscale for binarization
-            if len(warped.shape) == 3:
-                gray = cv2.cvtColor(warped, cv2.COLOR_BGR2GRAY)
+            # Corners arrive ordered as seen on screen (get_points); with a
+            # rotated view that is not image order, so don't re-sort here.
+            src = np.array(self.points, dtype=np.float32)
+
+            # Only the bounding box of the selection feeds the warp; crop
+            # to it (plus a pixel for bilinear taps) and shift the points.
+            h, w = self.image.shape[:2]
+            x0, y0 = np.floor(src.min(axis=0)).astype(int) - 1
+            x1, y1 = np.ceil(src.max(axis=0)).astype(int) + 2
+            x0, y0 = max(int(x0), 0), max(int(y0), 0)
+            x1, y1 = min(int(x1), w), min(int(y1), h)
+            if x1 <= x0 or y1 <= y0:
+                raise ValueError("Selection lies outside the image.")
+            roi = self.image[y0:y1, x0:x1]
+            src -= np.array([x0, y0], dtype=np.float32)
+
+            # warpPerspective builds its fixed-point coordinate map block by
+            # block in cache; a precomputed CV_16SC2 map for cv2.remap has to
+            # be streamed from memory instead and measured slower.
+            M_inv = _warp_matrix(src.tobytes())
+            flags = cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP
+
+            # Warp (and convert to grayscale) into the preallocated buffers.
+            # Both steps are linear, so their order is free: a single-channel
+            # warp is ~3× cheaper, which pays for graying the ROI first
+            # unless the ROI is much larger than the 500×100 output.
+            gray = self._gray_buf
+            if roi.ndim == 3 and roi.shape[0] * roi.shape[1] <= 4 * gray.size:
+                roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+            if roi.ndim == 3:
+                cv2.warpPerspective(roi, M_inv, (WARP_HI_W, WARP_HI_H),
+                                    dst=self._warp_buf, flags=flags)
+                cv2.cvtColor(self._warp_buf, cv2.COLOR_BGR2GRAY, dst=gray)
             else:
-                gray = warped
-
-            # "Mirror" step — adaptive threshold + median blur while high-res
-            binary = cv2.adaptiveThreshold(
-                gray, 255,
-                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY,
-                blockSize=11,
-                C=2,
-            )
-            binary = cv2.medianBlur(binary, 3)
+                cv2.warpPerspective(roi, M_inv, (WARP_HI_W, WARP_HI_H),
+                                    dst=gray, flags=flags)
 
-            # Downscale to final 140×28
-            strip = cv2.resize(binary, (FINAL_W, FINAL_H),
-                               interpolation=cv2.INTER_AREA)
-
-            self.signals.finished.emit(strip)
+            binarize_strip(gray, self._bin_buf, self.out_strip)
+            self.signals.finished.emit()
         except Exception as exc:
             self.signals.error.emit(str(exc))
 
 
+# ---------------------------------------------------------------------------
+# Image Loader / Folder Scanner (run on the thread pool)
+# ---------------------------------------------------------------------------
+def display_scale(img: np.ndarray) -> float:
+    """Factor that fits the image's long edge into DISPLAY_MAX_SIDE."""
+    return min(1.0, DISPLAY_MAX_SIDE / max(img.shape[:2]))
+
+
+def display_copy(img: np.ndarray) -> np.ndarray:
+    """Downscaled, contiguous copy for on-screen use (small images pass through)."""
+    scale = display_scale(img)
+    if scale < 1.0:
+        img = cv2.resize(img, None, fx=scale, fy=scale,
+                         interpolation=cv2.INTER_AREA)
+    return np.ascontiguousarray(img)
+
+
+class LoadSignals(QObject):
+    loaded = pyqtSignal(str, object, object)   # emits (path, image, display copy)
+
+
+class LoadWorker(QRunnable):
+    """Read, decode and shrink (for display) one image file off the UI thread."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.signals = LoadSignals()
+        self.path = path
+
+    def run(self):
+        try:
+            image = read_image_any(self.path, cv2.IMREAD_COLOR)
+            display = display_copy(image) if image is not None else None
+        except Exception:
+            image = display = None
+        self.signals.loaded.emit(self.path, image, display)
+
+
+class ScanSignals(QObject):
+    scanned = pyqtSignal(str, list)   # emits (folder, sorted image names)
+    error = pyqtSignal(str, str)      # emits (folder, message)
+
+
+class ScanWorker(QRunnable):
+    """List the image files of a folder off the UI thread."""
+
+    def __init__(self, folder: str):
+        super().__init__()
+        self.signals = ScanSignals()
+        self.folder = folder
+
+    def run(self):
+        try:
+            # DirEntry.is_file() uses the type from the directory listing,
+            # so this needs no per-file stat call on most platforms
+            with os.scandir(self.folder) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.lower().endswith(_EXT_TUPLE) and e.is_file()
+                )
+        except OSError as exc:
+            self.signals.error.emit(self.folder, str(exc))
+            return
+        self.signals.scanned.emit(self.folder, names)
+
+
 # ---------------------------------------------------------------------------
 # Draggable Handle (QGraphicsEllipseItem)
 # ---------------------------------------------------------------------------
+HANDLE_LABELS = ("TL", "TR", "BR", "BL")
+_LABEL_PIXMAPS: dict[str, QPixmap] = {}
+_LABEL_FONT = QFont("Consolas", 8, QFont.Weight.Bold)
+
+
+def _label_pixmap(text: str) -> QPixmap:
+    """Corner label rendered once to a small pixmap (needs a QApplication)."""
+    pixmap = _LABEL_PIXMAPS.get(text)
+    if pixmap is None:
+        pixmap = QPixmap(18, 14)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(_LABEL_FONT)
+        painter.setPen(QColor(Qt.GlobalColor.yellow))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        _LABEL_PIXMAPS[text] = pixmap
+    return pixmap
+
+
 class DraggableHandle(QGraphicsEllipseItem):
     """A circular handle the user can drag to fine-tune corner position."""
 
+    # Shared by every handle; built once at import time
+    _HANDLE_BRUSH = QBrush(HANDLE_COLOR)
+    _HOVER_BRUSH = QBrush(HANDLE_HOVER_COLOR)
+    _HANDLE_PEN = QPen(Qt.GlobalColor.white, 1)
+
     def __init__(self, x: float, y: float, index: int, parent_view):
         r = HANDLE_RADIUS
         super().__init__(-r, -r, 2 * r, 2 * r)
         self.setPos(x, y)
         self.index = index
         self.parent_view = parent_view
-        self.setBrush(QBrush(HANDLE_COLOR))
-        self.setPen(QPen(Qt.GlobalColor.white, 1))
+        self.setBrush(DraggableHandle._HANDLE_BRUSH)
+        self.setPen(DraggableHandle._HANDLE_PEN)
         self.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsMovable, True)
-        self.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CursorShape.SizeAllCursor)
         self.setZValue(20)
 
-        # Label text
-        labels = ["TL", "TR", "BR", "BL"]
-        self._label = QGraphicsTextItem(labels[index], self)
-        self._label.setDefaultTextColor(Qt.GlobalColor.yellow)
-        font = QFont("Consolas", 8, QFont.Weight.Bold)
-        self._label.setFont(font)
-        self._label.setPos(r + 2, -r - 2)
-
-    def itemChange(self, change, value):
-        if change == QGraphicsEllipseItem.GraphicsItemChange.ItemPositionHasChanged:
-            self.parent_view.update_lines()
-        return super().itemChange(change, value)
+        # Label (pre-rendered, so the scene never re-shapes text)
+        self._label = QGraphicsPixmapItem(_label_pixmap(HANDLE_LABELS[index]), self)
+        self._label.setPos(r + 4, -r)
 
     def hoverEnterEvent(self, event):
-        self.setBrush(QBrush(HANDLE_HOVER_COLOR))
+        self.setBrush(DraggableHandle._HOVER_BRUSH)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
-        self.setBrush(QBrush(HANDLE_COLOR))
+        self.setBrush(DraggableHandle._HANDLE_BRUSH)
         super().hoverLeaveEvent(event)
 
 
@@ -210,6 +416,7 @@ class ImageViewer(QGraphicsView):
     """Zoomable / pannable image viewer with 4-point polygon selection."""
 
     points_ready = pyqtSignal()   # emitted when 4 points placed
+    image_loaded = pyqtSignal()   # emitted when a requested image is shown
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -227,21 +434,76 @@ class ImageViewer(QGraphicsView):
         self.setBackgroundBrush(QBrush(QColor(30, 30, 30)))
 
         self._pixmap_item: QGraphicsPixmapItem | None = None
-        self._original_cv_image: np.ndarray | None = None
         self._cv_image: np.ndarray | None = None
+        # Full-res pixels per display pixel along (x, y); each axis of the
+        # display copy is rounded separately, so one factor isn't exact
+        self._full_res_scale = (1.0, 1.0)
         self._rotation_angle = 0
 
+        # path → (decoded image, display pixmap), least recently used first;
+        # decoded-but-unshown entries hold the display array instead, and
+        # are uploaded to a pixmap when first shown
+        self._img_cache: OrderedDict[str, tuple[np.ndarray, QPixmap | np.ndarray]] = OrderedDict()
+        self._loading: set[str] = set()     # paths being decoded
+        self._pending_path: str | None = None
+
         # Selection state
         self._handles: list[DraggableHandle] = []
         self._lines: list[QGraphicsLineItem] = []
         self._placing = False          # True while user is clicking corners
+        self._line_pts: list[tuple[float, float]] = []   # handle positions last drawn
+
+        # The scene batches item changes into one `changed` emission per
+        # event-loop pass; handle drags are picked up there, not per move
+        self._scene.changed.connect(self._on_scene_changed)
 
     # -- public API ----------------------------------------------------------
 
     def load_image(self, path: str):
-        """Load an image from disk and display it."""
-        img = read_image_any(path, cv2.IMREAD_COLOR)
+        """Show an image, decoding it on the thread pool if it isn't cached."""
+        cached = self._img_cache.get(path)
+        if cached is not None:
+            self._pending_path = None
+            self._finish_load_image(path, cached[0])
+            return
+
+        self._pending_path = path
+        self._cv_image = None
+        self._show_placeholder("Loading…")
+        self._start_decode(path)
+
+    def prefetch(self, path: str):
+        """Decode an image in the background so a later load_image is instant."""
+        if path not in self._img_cache:
+            self._start_decode(path)
+
+    def _start_decode(self, path: str):
+        if path in self._loading:
+            return
+        self._loading.add(path)
+        worker = LoadWorker(path)
+        worker.signals.loaded.connect(self._on_image_decoded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_image_decoded(self, path: str, img, display):
+        self._loading.discard(path)
+        if img is not None and path not in self._img_cache:
+            self._cache_image(path, img, display)
+        if path == self._pending_path:
+            self._pending_path = None
+            self._finish_load_image(path, img)
+
+    def _cache_image(self, path: str, img: np.ndarray,
+                     preview: QPixmap | np.ndarray):
+        self._img_cache[path] = (img, preview)
+        self._img_cache.move_to_end(path)
+        if len(self._img_cache) > IMAGE_CACHE_SIZE:
+            self._img_cache.popitem(last=False)
+
+    def _finish_load_image(self, path: str, img: np.ndarray | None):
+        """Display a decoded image (or report why it could not be read)."""
         if img is None:
+            self._show_placeholder("")
             if Path(path).suffix.lower() in {'.heic', '.heif'} and not HEIF_DECODER_AVAILABLE:
                 QMessageBox.warning(
                     self,
@@ -253,15 +515,30 @@ class ImageViewer(QGraphicsView):
                 return
             QMessageBox.warning(self, "Load Error", f"Cannot read:\n{path}")
             return
-        self._original_cv_image = img
-        self._cv_image = img.copy()
+
+        pixmap = self._img_cache[path][1]
+        if not isinstance(pixmap, QPixmap):
+            pixmap = self._to_pixmap(pixmap)
+            self._cache_image(path, img, pixmap)
+        else:
+            self._img_cache.move_to_end(path)
+
+        # Cached arrays are shared, never modified in place
+        self._cv_image = img
         self._rotation_angle = 0
-        self._render_cv_image(self._cv_image)
+        self._full_res_scale = (img.shape[1] / pixmap.width(),
+                                img.shape[0] / pixmap.height())
+        self._show_pixmap(pixmap)
         self._placing = False
+        self.image_loaded.emit()
 
     def set_rotation(self, angle_deg: int) -> bool:
-        """Rotate displayed image to an absolute angle in degrees (0-359)."""
-        if self._original_cv_image is None:
+        """Rotate displayed image to an absolute angle in degrees (0-359).
+
+        Only the view rotates (a Qt item transform); the decoded image is
+        left as-is and get_points maps the handles back into it.
+        """
+        if self._cv_image is None or self._pixmap_item is None:
             return False
 
         normalized = int(angle_deg) % 360
@@ -269,25 +546,30 @@ class ImageViewer(QGraphicsView):
             return False
 
         self._rotation_angle = normalized
-        if normalized == 0:
-            self._cv_image = self._original_cv_image.copy()
-        else:
-            self._cv_image = self._rotate_image(self._original_cv_image, normalized)
+        item = self._pixmap_item
+        item.setTransformOriginPoint(item.boundingRect().center())
+        item.setRotation(-normalized)   # counter-clockwise, like cv2
+        self._scene.setSceneRect(item.sceneBoundingRect())
+        self.fitInView(item, Qt.AspectRatioMode.KeepAspectRatio)
 
-        self._render_cv_image(self._cv_image)
         self._clear_selection()
         self._placing = False
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.setCursor(Qt.CursorShape.ArrowCursor)
         return True
 
-    def _render_cv_image(self, img: np.ndarray):
-        """Render the given OpenCV image onto the graphics scene."""
-        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        qimg = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
+    def _to_pixmap(self, img: np.ndarray) -> QPixmap:
+        """Wrap a contiguous BGR display copy as a QPixmap.
+
+        Only the display copy is shrunk; warping still reads the full-res
+        image, and get_points maps handle positions back to it.
+        """
+        h, w, ch = img.shape
+        qimg = QImage(img.data, w, h, ch * w, QImage.Format.Format_BGR888)
+        return QPixmap.fromImage(qimg)
 
+    def _show_pixmap(self, pixmap: QPixmap):
+        """Replace the scene contents with the given pixmap."""
         self._scene.clear()
         self._handles.clear()
         self._lines.clear()
@@ -295,29 +577,18 @@ class ImageViewer(QGraphicsView):
         self._scene.setSceneRect(QRectF(pixmap.rect().toRectF()))
         self.fitInView(self._pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
 
-    @staticmethod
-    def _rotate_image(image: np.ndarray, angle_deg: int) -> np.ndarray:
-        """Rotate image around center while expanding canvas to keep full content."""
-        h, w = image.shape[:2]
-        center = (w / 2.0, h / 2.0)
-        matrix = cv2.getRotationMatrix2D(center, angle_deg, 1.0)
-
-        cos_v = abs(matrix[0, 0])
-        sin_v = abs(matrix[0, 1])
-        new_w = int((h * sin_v) + (w * cos_v))
-        new_h = int((h * cos_v) + (w * sin_v))
-
-        matrix[0, 2] += (new_w / 2.0) - center[0]
-        matrix[1, 2] += (new_h / 2.0) - center[1]
-
-        return cv2.warpAffine(
-            image,
-            matrix,
-            (new_w, new_h),
-            flags=cv2.INTER_LINEAR,
-            borderMode=cv2.BORDER_CONSTANT,
-            borderValue=(0, 0, 0),
-        )
+    def _show_placeholder(self, text: str):
+        """Clear the scene, optionally showing a short status text."""
+        self._scene.clear()
+        self._handles.clear()
+        self._lines.clear()
+        self._pixmap_item = None
+        self._placing = False
+        if text:
+            item = self._scene.addText(text)
+            item.setDefaultTextColor(QColor(160, 160, 160))
+            self._scene.setSceneRect(item.boundingRect())
+            self.resetTransform()
 
     def start_selection(self):
         """Enter point-placement mode (clear old selection)."""
@@ -327,14 +598,19 @@ class ImageViewer(QGraphicsView):
         self.setCursor(Qt.CursorShape.CrossCursor)
 
     def get_points(self) -> np.ndarray | None:
-        """Return ordered 4×2 float32 array or None."""
-        if len(self._handles) != 4:
+        """Return ordered 4×2 float32 array (full-res image coordinates) or None.
+
+        Corners are ordered as seen on screen, i.e. after view rotation.
+        """
+        if len(self._handles) != 4 or self._pixmap_item is None:
             return None
-        raw = np.array(
-            [[h.pos().x(), h.pos().y()] for h in self._handles],
-            dtype=np.float32,
-        )
-        return order_points(raw)
+        pts = order_points(self._handle_points())
+        sx, sy = self._full_res_scale
+        for row in pts:
+            p = self._pixmap_item.mapFromScene(QPointF(row[0], row[1]))
+            row[0] = p.x() * sx
+            row[1] = p.y() * sy
+        return pts
 
     def get_cv_image(self) -> np.ndarray | None:
         return self._cv_image
@@ -349,6 +625,10 @@ class ImageViewer(QGraphicsView):
         self._handles.clear()
         self._lines.clear()
 
+    def _handle_points(self) -> list[tuple[float, float]]:
+        """The handles' scene positions as (x, y) pairs."""
+        return [(p.x(), p.y()) for p in (h.pos() for h in self._handles)]
+
     def _add_handle(self, scene_pos: QPointF):
         idx = len(self._handles)
         h = DraggableHandle(scene_pos.x(), scene_pos.y(), idx, self)
@@ -359,25 +639,18 @@ class ImageViewer(QGraphicsView):
             self._placing = False
             self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
             self.setCursor(Qt.CursorShape.ArrowCursor)
-            self._create_lines()
             self._reorder_handles()
+            self._create_lines()
             self.points_ready.emit()
 
     def _reorder_handles(self):
         """Re-label handles after auto-sorting so the labels match."""
-        pts = np.array(
-            [[h.pos().x(), h.pos().y()] for h in self._handles],
-            dtype=np.float32,
-        )
-        ordered = order_points(pts)
-        labels = ["TL", "TR", "BR", "BL"]
+        idx_map = {i: j for j, i in enumerate(corner_indices(self._handle_points()))}
         for i, h in enumerate(self._handles):
-            pos = np.array([h.pos().x(), h.pos().y()])
-            for j in range(4):
-                if np.allclose(pos, ordered[j], atol=0.5):
-                    h.index = j
-                    h._label.setPlainText(labels[j])
-                    break
+            j = idx_map.get(i)
+            if j is not None:
+                h.index = j
+                h._label.setPixmap(_label_pixmap(HANDLE_LABELS[j]))
         # Sort handles list by index so get_points returns them in order
         self._handles.sort(key=lambda h: h.index)
 
@@ -390,18 +663,20 @@ class ImageViewer(QGraphicsView):
             line.setZValue(10)
             self._scene.addItem(line)
             self._lines.append(line)
-        self.update_lines()
+        self._flush_lines()
+
+    def _on_scene_changed(self, _regions):
+        """Redraw the polygon once per batch of scene changes if a handle moved."""
+        if len(self._lines) == 4 and self._handle_points() != self._line_pts:
+            self._flush_lines()
 
-    def update_lines(self):
+    def _flush_lines(self):
         if len(self._handles) != 4 or len(self._lines) != 4:
             return
-        pts = [h.pos() for h in self._handles]
+        pts = self._line_pts = self._handle_points()
         for i in range(4):
-            j = (i + 1) % 4
-            self._lines[i].setLine(
-                pts[i].x(), pts[i].y(),
-                pts[j].x(), pts[j].y(),
-            )
+            (x0, y0), (x1, y1) = pts[i], pts[(i + 1) % 4]
+            self._lines[i].setLine(x0, y0, x1, y1)
 
     # -- events --------------------------------------------------------------
 
@@ -459,41 +734,188 @@ class PreviewWidget(QWidget):
         layout.addWidget(seg_box)
 
         self._strip_img: np.ndarray | None = None
-        self._segments: list[np.ndarray] = []
+        self._segments: np.ndarray | None = None   # (NUM_SEGMENTS, 28, 28)
+
+        # Display images reused by every extraction; upscales write into them
+        self._strip_qimg = QImage(FINAL_W * 3, FINAL_H * 3,
+                                  QImage.Format.Format_Grayscale8)
+        self._big_qimg = QImage(FINAL_W * 2, FINAL_H * 2,
+                                QImage.Format.Format_Grayscale8)
+
+    @staticmethod
+    def _qimage_pixels(qimg: QImage) -> np.ndarray:
+        """Writable (h, w) view of a Grayscale8 QImage's own pixel buffer."""
+        ptr = qimg.bits()       # non-const access detaches if shared
+        ptr.setsize(qimg.sizeInBytes())
+        rows = np.frombuffer(ptr, np.uint8).reshape(qimg.height(), qimg.bytesPerLine())
+        return rows[:, :qimg.width()]
 
     def set_strip(self, strip: np.ndarray):
         self._strip_img = strip
-        self._segments = []
         # Show strip (scale up for visibility)
-        disp = cv2.resize(strip, (FINAL_W * 3, FINAL_H * 3),
-                          interpolation=cv2.INTER_NEAREST)
-        qimg = QImage(disp.data, disp.shape[1], disp.shape[0],
-                       disp.shape[1], QImage.Format.Format_Grayscale8)
-        self._strip_label.setPixmap(QPixmap.fromImage(qimg))
+        cv2.resize(strip, (FINAL_W * 3, FINAL_H * 3),
+                   dst=self._qimage_pixels(self._strip_qimg),
+                   interpolation=cv2.INTER_NEAREST)
+        self._strip_label.setPixmap(QPixmap.fromImage(self._strip_qimg))
+
+        # Segment into 5 cells, kept as one contiguous block
+        self._segments = np.ascontiguousarray(
+            strip.reshape(FINAL_H, NUM_SEGMENTS, SEGMENT_SIZE).transpose(1, 0, 2)
+        )
 
-        # Segment into 5 cells
-        for i in range(NUM_SEGMENTS):
-            x0 = i * SEGMENT_SIZE
-            seg = strip[:, x0:x0 + SEGMENT_SIZE]
-            self._segments.append(seg)
-            disp_seg = cv2.resize(seg, (56, 56),
-                                  interpolation=cv2.INTER_NEAREST)
-            qimg_s = QImage(disp_seg.data, 56, 56, 56,
-                            QImage.Format.Format_Grayscale8)
-            self._seg_labels[i].setPixmap(QPixmap.fromImage(qimg_s))
+        # Upscale the whole strip 2× once and cut the 56×56 cells out of it
+        cv2.resize(strip, (FINAL_W * 2, FINAL_H * 2),
+                   dst=self._qimage_pixels(self._big_qimg),
+                   interpolation=cv2.INTER_NEAREST)
+        big_pixmap = QPixmap.fromImage(self._big_qimg)
+        cell = SEGMENT_SIZE * 2
+        for i, lbl in enumerate(self._seg_labels):
+            lbl.setPixmap(big_pixmap.copy(i * cell, 0, cell, cell))
 
     def get_segments(self) -> list[np.ndarray]:
-        return self._segments
+        return [] if self._segments is None else list(self._segments)
 
     def clear(self):
         self._strip_img = None
-        self._segments = []
+        self._segments = None
         self._strip_label.setText("No preview yet")
         self._strip_label.setPixmap(QPixmap())
         for lbl in self._seg_labels:
             lbl.setPixmap(QPixmap())
 
 
+# ---------------------------------------------------------------------------
+# Invert Colors (batch worker + per-file job, run on thread pools)
+# ---------------------------------------------------------------------------
+_INVERT_OK, _INVERT_SKIPPED, _INVERT_FAILED = range(3)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_INVERT_TABLE = bytes(range(255, -1, -1))   # bytes.translate: b -> 255 - b
+
+
+def _invert_png_palette(data: bytes) -> bytes | None:
+    """The PNG with its PLTE colours inverted, or None if that isn't enough.
+
+    Pixels of an indexed PNG are palette indices, so inverting the palette
+    inverts the image without touching IDAT. Files with tRNS are left to
+    the generic path, which inverts their alpha as well.
+    """
+    # IHDR is always first: colour type 3 (indexed) sits at byte 25
+    if (len(data) < 33 or not data.startswith(_PNG_SIGNATURE)
+            or data[12:16] != b"IHDR" or data[25] != 3):
+        return None
+    chunks = [_PNG_SIGNATURE]
+    found = False
+    pos = len(_PNG_SIGNATURE)
+    while pos + 12 <= len(data):
+        length, ctype = struct.unpack_from(">I4s", data, pos)
+        end = pos + 12 + length
+        if end > len(data) or ctype == b"tRNS":
+            return None
+        if ctype == b"PLTE":
+            body = data[pos + 8:end - 4].translate(_INVERT_TABLE)
+            chunks.append(data[pos:pos + 8] + body
+                          + struct.pack(">I", zlib.crc32(ctype + body)))
+            found = True
+        else:
+            chunks.append(data[pos:end])
+        pos = end
+        if ctype == b"IEND":
+            break
+    return b"".join(chunks) if found else None
+
+
+def _invert_one(src_path: str, dst_path: str) -> int:
+    """Invert one image file into dst_path; returns an _INVERT_* status."""
+    if not src_path.lower().endswith(".png"):
+        try:
+            src_img = read_image_any(src_path, cv2.IMREAD_UNCHANGED)
+        except Exception:
+            return _INVERT_SKIPPED      # e.g. cv2.error on a corrupt header
+    else:
+        try:
+            with open(src_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return _INVERT_SKIPPED
+        inverted = _invert_png_palette(data)
+        if inverted is not None:
+            try:
+                with open(dst_path, "wb") as f:
+                    f.write(inverted)
+            except OSError:
+                return _INVERT_FAILED
+            return _INVERT_OK
+        try:
+            src_img = cv2.imdecode(np.frombuffer(data, np.uint8),
+                                   cv2.IMREAD_UNCHANGED) if data else None
+        except cv2.error:
+            return _INVERT_SKIPPED
+    if src_img is None:
+        return _INVERT_SKIPPED
+    cv2.bitwise_not(src_img, dst=src_img)      # in place; the decode is ours
+    return _INVERT_OK if write_image_any(dst_path, src_img) else _INVERT_FAILED
+
+
+class InvertSignals(QObject):
+    progress = pyqtSignal(int, int)         # emits (files done, files total)
+    finished = pyqtSignal(int, int, int)    # emits (processed, skipped, errors)
+    error = pyqtSignal(str)
+
+
+class InvertWorker(QRunnable):
+    """Invert every image of the digit folders into the output folder."""
+
+    def __init__(self, input_parent: str, output_parent: str,
+                 digit_folders: list[str]):
+        super().__init__()
+        self.signals = InvertSignals()
+        self.input_parent = input_parent
+        self.output_parent = output_parent
+        self.digit_folders = digit_folders
+
+    def run(self):
+        try:
+            counts = self._invert_all()
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+            return
+        self.signals.finished.emit(*counts)
+
+    def _invert_all(self) -> tuple[int, int, int]:
+        jobs: list[tuple[str, str]] = []
+        skipped_count = 0
+
+        for digit in self.digit_folders:
+            src_dir = os.path.join(self.input_parent, digit)
+            dst_dir = os.path.join(self.output_parent, digit)
+            os.makedirs(dst_dir, exist_ok=True)
+
+            # DirEntry caches the file type from the listing (no stat per file)
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.lower().endswith(_EXT_TUPLE) and entry.is_file()):
+                        skipped_count += 1
+                        continue
+                    jobs.append((entry.path, os.path.join(dst_dir, name)))
+
+        # Decode, invert and encode all release the GIL, so plain threads
+        # overlap the per-file work
+        total = len(jobs)
+        self.signals.progress.emit(0, total)
+        counts = [0, 0, 0]      # indexed by _INVERT_* status
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [pool.submit(_invert_one, src, dst) for src, dst in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                counts[future.result()] += 1
+                if done % INVERT_PROGRESS_STEP == 0:
+                    self.signals.progress.emit(done, total)
+
+        return (counts[_INVERT_OK],
+                skipped_count + counts[_INVERT_SKIPPED],
+                counts[_INVERT_FAILED])
+
+
 # ---------------------------------------------------------------------------
 # Main Window
 # ---------------------------------------------------------------------------
@@ -503,7 +925,30 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("DigitExtractor — Image Dataset Extractor")
         self.resize(1280, 800)
         self._output_dir = ""
-        self._worker: WarpWorker | None = None
+        self._folder = ""           # folder whose files are listed
+        self._scan_folder = ""      # folder of the most recent scan request
+        self._worker = WarpWorker()
+        # Extraction gets its own single thread, kept alive for the session:
+        # jobs serialize on the worker's scratch buffers and never queue
+        # behind image decodes on the global pool.
+        self._warp_pool = QThreadPool(self)
+        self._warp_pool.setMaxThreadCount(1)
+        self._warp_pool.setExpiryTimeout(-1)
+        # Invert Colors holds its thread for a whole batch; keep it off the
+        # global pool so image loads don't queue behind it
+        self._invert_pool = QThreadPool(self)
+        self._invert_pool.setMaxThreadCount(1)
+        # Double-buffered extraction output: the worker fills the back
+        # buffer while the front one stays on display
+        self._strip_bufs = [np.empty((FINAL_H, FINAL_W), np.uint8)
+                            for _ in range(2)]
+        self._strip_front = 0
+        # One extraction runs at a time; the generation is bumped whenever
+        # the image, rotation or selection is reset, so a run that finishes
+        # after that is dropped instead of shown
+        self._warp_busy = False
+        self._extract_gen = 0
+        self._warp_job_gen = 0
 
         self._build_ui()
         self._build_menu()
@@ -658,9 +1103,9 @@ class MainWindow(QMainWindow):
         view_menu.addAction(act_fit)
 
         tool_menu = menu.addMenu("&Tool")
-        act_invert_colors = QAction("Invert Colors", self)
-        act_invert_colors.triggered.connect(self._on_invert_colors)
-        tool_menu.addAction(act_invert_colors)
+        self._act_invert_colors = QAction("Invert Colors", self)
+        self._act_invert_colors.triggered.connect(self._on_invert_colors)
+        tool_menu.addAction(self._act_invert_colors)
 
     def _connect_signals(self):
         self.findChild(QPushButton, "btnOpenFolder").clicked.connect(
@@ -673,6 +1118,9 @@ class MainWindow(QMainWindow):
         self._btn_output.clicked.connect(self._on_set_output)
         self._rotation_slider.valueChanged.connect(self._on_rotation_changed)
         self._viewer.points_ready.connect(self._on_points_ready)
+        self._viewer.image_loaded.connect(self._on_image_loaded)
+        self._worker.signals.finished.connect(self._on_warp_done)
+        self._worker.signals.error.connect(self._on_warp_error)
 
     # -- Slots ---------------------------------------------------------------
 
@@ -681,43 +1129,66 @@ class MainWindow(QMainWindow):
         if not folder:
             return
         self._file_list.clear()
-        files = sorted(
-            p for p in Path(folder).iterdir()
-            if p.suffix.lower() in IMAGE_EXTENSIONS
-        )
+        self._scan_folder = folder
+        self._statusbar.showMessage(f"Scanning {folder}…")
+        worker = ScanWorker(folder)
+        worker.signals.scanned.connect(self._on_folder_scanned)
+        worker.signals.error.connect(self._on_folder_scan_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_folder_scanned(self, folder: str, files: list[str]):
+        if folder != self._scan_folder:
+            return      # superseded by a newer Open Folder
         if not files:
             QMessageBox.information(self, "No Images",
                                     "No supported image files found.")
             return
-        for f in files:
-            item = QListWidgetItem(f.name)
-            item.setData(Qt.ItemDataRole.UserRole, str(f))
-            self._file_list.addItem(item)
+        self._folder = folder
+        self._file_list.addItems(files)
         self._statusbar.showMessage(f"Loaded {len(files)} images from {folder}")
         self._file_list.setCurrentRow(0)
 
+    def _on_folder_scan_error(self, folder: str, msg: str):
+        if folder != self._scan_folder:
+            return
+        QMessageBox.warning(self, "Open Folder", f"Cannot read folder:\n{msg}")
+        self._statusbar.showMessage("Ready — open a folder to begin.")
+
     def _on_file_selected(self, row: int):
         if row < 0:
             return
         item = self._file_list.item(row)
-        path = item.data(Qt.ItemDataRole.UserRole)
+        path = os.path.join(self._folder, item.text())
+        self._extract_gen += 1
+        self._rotation_slider.setEnabled(False)
+        self._btn_select.setEnabled(False)
+        self._btn_extract.setEnabled(False)
+        self._btn_save.setEnabled(False)
+        self._preview.clear()
+        self._statusbar.showMessage(f"Viewing: {item.text()}")
         self._viewer.load_image(path)
+
+        # Users step through folders in order; decode the neighbours early
+        # (next first, then previous for stepping back)
+        for neighbour in (row + 1, row - 1):
+            near_item = self._file_list.item(neighbour) if neighbour >= 0 else None
+            if near_item is not None:
+                self._viewer.prefetch(os.path.join(self._folder, near_item.text()))
+
+    def _on_image_loaded(self):
         self._rotation_slider.blockSignals(True)
         self._rotation_slider.setValue(0)
         self._rotation_slider.blockSignals(False)
         self._rotation_slider.setEnabled(True)
         self._rotation_value.setText("0°")
         self._btn_select.setEnabled(True)
-        self._btn_extract.setEnabled(False)
-        self._btn_save.setEnabled(False)
-        self._preview.clear()
-        self._statusbar.showMessage(f"Viewing: {item.text()}")
 
     def _on_rotation_changed(self, angle: int):
         self._rotation_value.setText(f"{angle}°")
         changed = self._viewer.set_rotation(angle)
         if not changed:
             return
+        self._extract_gen += 1
         self._btn_extract.setEnabled(False)
         self._btn_save.setEnabled(False)
         self._preview.clear()
@@ -727,6 +1198,7 @@ class MainWindow(QMainWindow):
 
     def _on_start_select(self):
         self._viewer.start_selection()
+        self._extract_gen += 1
         self._btn_extract.setEnabled(False)
         self._btn_save.setEnabled(False)
         self._preview.clear()
@@ -735,7 +1207,7 @@ class MainWindow(QMainWindow):
         )
 
     def _on_points_ready(self):
-        self._btn_extract.setEnabled(True)
+        self._btn_extract.setEnabled(not self._warp_busy)
         self._statusbar.showMessage(
             "4 points placed (auto-sorted). "
             "Drag handles to fine-tune, then click Extract."
@@ -744,26 +1216,35 @@ class MainWindow(QMainWindow):
     def _on_extract(self):
         pts = self._viewer.get_points()
         img = self._viewer.get_cv_image()
-        if pts is None or img is None:
+        if pts is None or img is None or self._warp_busy:
             return
+        self._warp_busy = True
+        self._warp_job_gen = self._extract_gen
         self._btn_extract.setEnabled(False)
         self._statusbar.showMessage("Processing…")
-        self._worker = WarpWorker(img, pts)
-        self._worker.signals.finished.connect(self._on_warp_done)
-        self._worker.signals.error.connect(self._on_warp_error)
-        self._worker.start()
-
-    def _on_warp_done(self, strip: np.ndarray):
-        self._preview.set_strip(strip)
-        self._btn_extract.setEnabled(True)
+        self._worker.set_job(img, pts, self._strip_bufs[1 - self._strip_front])
+        self._warp_pool.start(self._worker)
+
+    def _finish_warp(self) -> bool:
+        """Mark the run finished; True if its result is still wanted."""
+        self._warp_busy = False
+        self._btn_extract.setEnabled(self._viewer.get_points() is not None)
+        return self._warp_job_gen == self._extract_gen
+
+    def _on_warp_done(self):
+        if not self._finish_warp():
+            return      # image, rotation or selection changed meanwhile
+        self._strip_front = 1 - self._strip_front
+        self._preview.set_strip(self._strip_bufs[self._strip_front])
         self._btn_save.setEnabled(True)
         self._statusbar.showMessage(
             "Extraction complete — enter a 5-char label and save."
         )
 
     def _on_warp_error(self, msg: str):
+        if not self._finish_warp():
+            return
         QMessageBox.critical(self, "Processing Error", msg)
-        self._btn_extract.setEnabled(True)
         self._statusbar.showMessage("Error during processing.")
 
     def _on_set_output(self):
@@ -790,14 +1271,20 @@ class MainWindow(QMainWindow):
             if not self._output_dir:
                 return
 
-        saved = 0
-        for i, seg in enumerate(segments):
-            char = label[i]
-            char_dir = os.path.join(self._output_dir, char)
-            os.makedirs(char_dir, exist_ok=True)
-            fname = f"segment_{uuid.uuid4().hex[:8]}.png"
-            cv2.imwrite(os.path.join(char_dir, fname), seg)
-            saved += 1
+        for char in set(label):
+            os.makedirs(os.path.join(self._output_dir, char), exist_ok=True)
+
+        futures = [
+            _SAVE_POOL.submit(
+                write_image_any,
+                os.path.join(self._output_dir, char,
+                             f"segment_{uuid.uuid4().hex[:8]}.png"),
+                seg, PNG_WRITE_PARAMS,
+            )
+            for char, seg in zip(label, segments)
+        ]
+        wait(futures)
+        saved = sum(f.result() for f in futures)
 
         self._statusbar.showMessage(
             f"Saved {saved} segments for label '{label}' → {self._output_dir}"
@@ -830,12 +1317,32 @@ class MainWindow(QMainWindow):
         if not output_parent:
             return
 
-        processed_count, skipped_count, error_count = self._invert_category_images(
-            input_parent,
-            output_parent,
-            digit_folders
+        self._act_invert_colors.setEnabled(False)
+        self._statusbar.showMessage("Inverting images…")
+        worker = InvertWorker(input_parent, output_parent, digit_folders)
+        worker.signals.progress.connect(self._on_invert_progress)
+        worker.signals.finished.connect(
+            lambda processed, skipped, errors: self._on_invert_done(
+                input_parent, output_parent, digit_folders,
+                processed, skipped, errors
+            )
         )
+        worker.signals.error.connect(self._on_invert_error)
+        self._invert_pool.start(worker)
 
+    def _on_invert_progress(self, done: int, total: int):
+        self._statusbar.showMessage(f"Inverting images… {done}/{total}")
+
+    def _on_invert_done(
+        self,
+        input_parent: str,
+        output_parent: str,
+        digit_folders: list[str],
+        processed_count: int,
+        skipped_count: int,
+        error_count: int
+    ):
+        self._act_invert_colors.setEnabled(True)
         self._statusbar.showMessage(
             f"Invert complete — processed: {processed_count}, "
             f"skipped: {skipped_count}, errors: {error_count}"
@@ -852,69 +1359,50 @@ class MainWindow(QMainWindow):
             f"Errors while saving: {error_count}"
         )
 
+    def _on_invert_error(self, msg: str):
+        self._act_invert_colors.setEnabled(True)
+        self._statusbar.showMessage("Invert Colors failed.")
+        QMessageBox.warning(self, "Invert Colors", f"Processing failed:\n{msg}")
+
     def _validate_digit_category_parent(
         self,
         parent_folder: str
     ) -> tuple[bool, str, list[str]]:
+        # One pass over the listing sorts subfolders into digit / invalid
+        digit_folders: list[str] = []
+        invalid_names: list[str] = []
         try:
-            children = [p for p in Path(parent_folder).iterdir() if p.is_dir()]
+            with os.scandir(parent_folder) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    name = entry.name
+                    if len(name) == 1 and name.isdigit():
+                        digit_folders.append(name)
+                    else:
+                        invalid_names.append(name)
         except OSError as exc:
             return False, f"Cannot access selected folder:\n{exc}", []
 
-        if not children:
+        if invalid_names:
             return (
                 False,
-                "Selected folder has no subfolders. "
-                "It must contain at least one digit-named subfolder (0-9).",
+                "All direct subfolders must be a single digit name (0-9).\n\n"
+                f"Invalid subfolder(s): {', '.join(sorted(invalid_names))}",
                 []
             )
 
-        invalid_names = [p.name for p in children if not (p.name.isdigit() and len(p.name) == 1)]
-        if invalid_names:
+        if not digit_folders:
             return (
                 False,
-                "All direct subfolders must be a single digit name (0-9).\n\n"
-                f"Invalid subfolder(s): {', '.join(sorted(invalid_names))}",
+                "Selected folder has no subfolders. "
+                "It must contain at least one digit-named subfolder (0-9).",
                 []
             )
 
-        digit_folders = sorted([p.name for p in children], key=int)
+        digit_folders.sort(key=int)
         return True, "", digit_folders
 
-    def _invert_category_images(
-        self,
-        input_parent: str,
-        output_parent: str,
-        digit_folders: list[str]
-    ) -> tuple[int, int, int]:
-        processed_count = 0
-        skipped_count = 0
-        error_count = 0
-
-        for digit in digit_folders:
-            src_dir = Path(input_parent) / digit
-            dst_dir = Path(output_parent) / digit
-            dst_dir.mkdir(parents=True, exist_ok=True)
-
-            for entry in src_dir.iterdir():
-                if not entry.is_file() or entry.suffix.lower() not in IMAGE_EXTENSIONS:
-                    skipped_count += 1
-                    continue
-
-                src_img = read_image_any(str(entry), cv2.IMREAD_UNCHANGED)
-                if src_img is None:
-                    skipped_count += 1
-                    continue
-
-                inverted = cv2.bitwise_not(src_img)
-                save_path = dst_dir / entry.name
-                if cv2.imwrite(str(save_path), inverted):
-                    processed_count += 1
-                else:
-                    error_count += 1
-
-        return processed_count, skipped_count, error_count
-
 
 # ---------------------------------------------------------------------------
 # Entry point
@@ -923,6 +1411,13 @@ def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
 
+    # Pin OpenCV's setup instead of trusting the wheel's build defaults.
+    # Intra-op threads stay on for the full-frame decode/resize work; the
+    # per-file batches already fan out on Python thread pools, and OpenCV
+    # runs its calls on tiny crops serially regardless of this setting.
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(os.cpu_count() or 1)
+
     # Dark palette for Fusion
     from PyQt6.QtGui import QPalette
     palette = QPalette()